@@ -19,6 +19,8 @@ from semantic_kernel.kernel import Kernel
 AGENT_NAME = "FileManipulation"
 AGENT_INSTRUCTIONS = "Find answers to the user's questions in the provided file."
 
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "resources")
+
 
 # A helper method to invoke the agent with the user input
 async def invoke_agent(agent: OpenAIAssistantAgent, thread_id: str, input: str) -> None:
@@ -46,12 +48,7 @@ async def main():
     service_id = "agent"
 
     # Get the path to the sales.csv file
-    csv_file_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
-        "resources",
-        "agent_assistant_file_manipulation",
-        "sales.csv",
-    )
+    csv_file_path = os.path.join(RESOURCES_DIR, "agent_assistant_file_manipulation", "sales.csv")
 
     # Create the assistant agent
     agent = await AzureAssistantAgent.create(
@@ -21,6 +21,8 @@ from semantic_kernel.kernel import Kernel
 
 SUMMARY_INSTRUCTIONS = "Summarize the entire conversation for the user in natural language."
 
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "resources")
+
 
 def _create_kernel_with_chat_completion(service_id: str) -> Kernel:
     kernel = Kernel()
@@ -47,13 +49,9 @@ async def invoke_agent(
 
 
 async def main():
+    analyst_agent = None
     try:
-        file_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
-            "resources",
-            "mixed_chat_files",
-            "user-context.txt",
-        )
+        file_path = os.path.join(RESOURCES_DIR, "mixed_chat_files", "user-context.txt")
 
         analyst_agent = await OpenAIAssistantAgent.create(
             service_id="analyst",
@@ -84,7 +82,10 @@ async def main():
         await invoke_agent(chat=chat, agent=summary_agent)
     finally:
         if analyst_agent is not None:
-            [await analyst_agent.delete_file(file_id=file_id) for file_id in analyst_agent.code_interpreter_file_ids]
+            # the file deletions are independent, so they are sent concurrently
+            await asyncio.gather(*[
+                analyst_agent.delete_file(file_id=file_id) for file_id in analyst_agent.code_interpreter_file_ids
+            ])
             await analyst_agent.delete()
 
 
@@ -2,7 +2,6 @@
 
 import asyncio
 import os
-from functools import reduce
 from typing import TYPE_CHECKING
 
 from semantic_kernel import Kernel
@@ -141,7 +140,7 @@ async def handle_streaming(
             print(str(message[0]), end="")
 
     if streamed_chunks:
-        streaming_chat_message = reduce(lambda first, second: first + second, streamed_chunks)
+        streaming_chat_message = StreamingChatMessageContent.concat(streamed_chunks)
         if hasattr(streaming_chat_message, "content"):
             print(streaming_chat_message.content)
         print("Auto tool calls is disabled, printing returned tool calls...")
@@ -0,0 +1,138 @@
+# Copyright (c) Microsoft. All rights reserved.
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import numpy as np
+
+from semantic_kernel.connectors.ai.open_ai import OpenAIChatCompletion, OpenAITextEmbedding
+from semantic_kernel.contents import ChatHistory
+from semantic_kernel.filters.filter_types import FilterTypes
+from semantic_kernel.filters.functions.function_invocation_context import FunctionInvocationContext
+from semantic_kernel.functions import FunctionResult, KernelArguments
+from semantic_kernel.kernel import Kernel
+
+# This sample shows how a function invocation filter can be used as a semantic cache.
+# Before the chat function is invoked, the user input is embedded and compared (cosine similarity)
+# with the inputs that were answered before. If a previous input is similar enough, the stored
+# result is returned and the call to the model is skipped entirely.
+# The cache is scoped per system message, so changing the persona does not return stale answers.
+# The scope deliberately leaves out the rest of the history: that grows with every turn,
+# so a repeated question would never find the earlier answer.
+
+SIMILARITY_THRESHOLD = 0.95
+
+system_message = """
+You are a chat bot. Your name is Mosscap and
+you have one goal: figure out what people need.
+Your full name, should you need to know it, is
+Splendid Speckled Mosscap. You communicate
+effectively, but you tend to answer with long
+flowery prose.
+"""
+
+
+class SemanticCache:
+    """A minimal in-memory semantic cache, storing the normalized embeddings of each scope in one matrix."""
+
+    def __init__(self, embedding_service: OpenAITextEmbedding, threshold: float = SIMILARITY_THRESHOLD):
+        self.embedding_service = embedding_service
+        self.threshold = threshold
+        self._embeddings: dict[str, np.ndarray] = {}
+        self._results: dict[str, list[FunctionResult]] = {}
+
+    async def embed(self, text: str) -> np.ndarray:
+        embedding = (await self.embedding_service.generate_embeddings([text]))[0].astype(np.float32)
+        return embedding / np.linalg.norm(embedding)
+
+    @staticmethod
+    def scope(chat_history: ChatHistory) -> str:
+        """The system message, as the context a cached answer is valid for."""
+        return str(chat_history.messages[0].content) if chat_history.messages else ""
+
+    def get(self, scope: str, embedding: np.ndarray) -> FunctionResult | None:
+        if scope not in self._embeddings:
+            return None
+        # all stored vectors are normalized, so a single matrix-vector product gives the cosine similarities
+        similarities = self._embeddings[scope] @ embedding
+        best = int(np.argmax(similarities))
+        return self._results[scope][best] if similarities[best] >= self.threshold else None
+
+    def add(self, scope: str, embedding: np.ndarray, result: FunctionResult) -> None:
+        if scope in self._embeddings:
+            self._embeddings[scope] = np.vstack([self._embeddings[scope], embedding])
+        else:
+            self._embeddings[scope] = embedding[np.newaxis, :]
+        self._results.setdefault(scope, []).append(result)
+
+    async def filter(
+        self,
+        context: FunctionInvocationContext,
+        next: Callable[[FunctionInvocationContext], Coroutine[Any, Any, None]],
+    ) -> None:
+        user_input = context.arguments.get("user_input")
+        if not user_input:
+            await next(context)
+            return
+        scope = self.scope(context.arguments["chat_history"])
+        embedding = await self.embed(user_input)
+        if cached := self.get(scope, embedding):
+            print("(from cache) ", end="")
+            context.result = cached
+            return
+        await next(context)
+        if context.result:
+            self.add(scope, embedding, context.result)
+
+
+kernel = Kernel()
+kernel.add_service(OpenAIChatCompletion(service_id="chat"))
+
+cache = SemanticCache(OpenAITextEmbedding(ai_model_id="text-embedding-3-small"))
+kernel.add_filter(FilterTypes.FUNCTION_INVOCATION, cache.filter)
+
+chat_function = kernel.add_function(
+    prompt="{{$chat_history}}{{$user_input}}",
+    plugin_name="ChatBot",
+    function_name="Chat",
+)
+
+history = ChatHistory()
+history.add_system_message(system_message)
+
+
+async def chat() -> bool:
+    try:
+        user_input = input("User:> ")
+    except KeyboardInterrupt:
+        print("\n\nExiting chat...")
+        return False
+    except EOFError:
+        print("\n\nExiting chat...")
+        return False
+
+    if user_input == "exit":
+        print("\n\nExiting chat...")
+        return False
+
+    result = await kernel.invoke(chat_function, KernelArguments(user_input=user_input, chat_history=history))
+    print(f"Mosscap:> {result}")
+    history.add_user_message(user_input)
+    history.add_assistant_message(str(result))
+    return True
+
+
+async def main() -> None:
+    chatting = True
+    print(
+        "Welcome to the chat bot!\
+        \n  Type 'exit' to exit.\
+        \n  Ask the same question twice, or rephrase it slightly, to see the cache in action."
+    )
+    while chatting:
+        chatting = await chat()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,12 +1,14 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 from dataclasses import dataclass, field
-from typing import Annotated, Any
+from typing import Annotated, Any, TypeVar
 from uuid import uuid4
 
+import numpy as np
 from pandas import DataFrame
-from pydantic import Field
+from pydantic import BeforeValidator, Field, PlainSerializer
 
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import EmbeddingGeneratorBase
 from semantic_kernel.data import (
     VectorStoreRecordDataField,
     VectorStoreRecordDefinition,
@@ -40,55 +42,104 @@ from semantic_kernel.kernel_pydantic import KernelBaseModel
 # like a dict or list.
 # Or you can use the definition in container mode with something like a Pandas Dataframe.
 
+# The vectors in these models are stored as float32 numpy arrays, which take 4 bytes per dimension,
+# instead of a list of Python floats, and many records can be stacked into a single matrix for fast similarity math.
+# The serialize and deserialize functions on the vector field convert from and to the list of floats the stores use.
+# Because == on arrays is elementwise, the models compare their fields with records_equal,
+# and the pydantic models serialize the vector as a list when dumping to JSON.
+
+
+def as_float32(vector: list[float] | np.ndarray) -> np.ndarray:
+    return np.asarray(vector, dtype=np.float32)
+
+
+def float32_vector_field() -> VectorStoreRecordVectorField:
+    return VectorStoreRecordVectorField(
+        property_type="float", serialize_function=np.ndarray.tolist, deserialize_function=as_float32
+    )
+
+
+def records_equal(record: Any, other: Any) -> bool:
+    if type(record) is not type(other):
+        return NotImplemented
+    if record.__dict__.keys() != other.__dict__.keys():
+        return False
+    return all(
+        np.array_equal(value, other.__dict__[name]) if isinstance(value, np.ndarray) else value == other.__dict__[name]
+        for name, value in record.__dict__.items()
+    )
+
 
 # Data model using built-in Python dataclasses
 @vectorstoremodel
 @dataclass
 class DataModelDataclass:
-    vector: Annotated[list[float], VectorStoreRecordVectorField]
+    vector: Annotated[np.ndarray, float32_vector_field()]
     key: Annotated[str, VectorStoreRecordKeyField()] = field(default_factory=lambda: str(uuid4()))
     content: Annotated[str, VectorStoreRecordDataField(has_embedding=True, embedding_property_name="vector")] = (
         "content1"
     )
     other: str | None = None
 
+    def __post_init__(self):
+        self.vector = as_float32(self.vector)
+
+    __eq__ = records_equal
+
 
 # Data model using Pydantic BaseModels
 @vectorstoremodel
 class DataModelPydantic(KernelBaseModel):
-    vector: Annotated[list[float], VectorStoreRecordVectorField]
+    vector: Annotated[
+        np.ndarray,
+        BeforeValidator(as_float32),
+        PlainSerializer(np.ndarray.tolist, when_used="json"),
+        float32_vector_field(),
+    ]
     key: Annotated[str, VectorStoreRecordKeyField()] = Field(default_factory=lambda: str(uuid4()))
     content: Annotated[str, VectorStoreRecordDataField(has_embedding=True, embedding_property_name="vector")] = (
         "content1"
     )
     other: str | None = None
 
+    __eq__ = records_equal
+
 
 # Data model using Pydantic BaseModels with mixed annotations (from pydantic and SK)
 @vectorstoremodel
 class DataModelPydanticComplex(KernelBaseModel):
-    vector: Annotated[list[float], VectorStoreRecordVectorField]
+    vector: Annotated[
+        np.ndarray,
+        BeforeValidator(as_float32),
+        PlainSerializer(np.ndarray.tolist, when_used="json"),
+        float32_vector_field(),
+    ]
     key: Annotated[str, Field(default_factory=lambda: str(uuid4())), VectorStoreRecordKeyField()]
     content: Annotated[str, VectorStoreRecordDataField(has_embedding=True, embedding_property_name="vector")] = (
         "content1"
     )
     other: str | None = None
 
+    __eq__ = records_equal
+
 
 # Data model using Python classes
 # This one includes a custom serialize and deserialize method
+# and uses __slots__, so instances don't carry a __dict__, which saves memory when loading many records.
 @vectorstoremodel
 class DataModelPython:
+    __slots__ = ("vector", "other", "key", "content")
+
     def __init__(
         self,
-        vector: Annotated[list[float], VectorStoreRecordVectorField],
+        vector: Annotated[np.ndarray, float32_vector_field()],
         key: Annotated[str, VectorStoreRecordKeyField] = None,
         content: Annotated[
             str, VectorStoreRecordDataField(has_embedding=True, embedding_property_name="vector")
         ] = "content1",
         other: str | None = None,
     ):
-        self.vector = vector
+        self.vector = as_float32(vector)
         self.other = other
         self.key = key or str(uuid4())
         self.content = content
@@ -96,15 +147,15 @@ class DataModelPython:
     def __str__(self) -> str:
         return f"DataModelPython(vector={self.vector}, key={self.key}, content={self.content}, other={self.other})"
 
-    def serialize(self) -> dict[str, Any]:
+    def serialize(self, **kwargs: Any) -> dict[str, Any]:
         return {
-            "vector": self.vector,
+            "vector": self.vector.tolist(),
             "key": self.key,
             "content": self.content,
         }
 
     @classmethod
-    def deserialize(cls, obj: dict[str, Any]) -> "DataModelDataclass":
+    def deserialize(cls, obj: dict[str, Any], **kwargs: Any) -> "DataModelPython":
         return cls(
             vector=obj["vector"],
             key=obj["key"],
@@ -119,7 +170,7 @@ class DataModelPython:
 # these should be specific to the type used, if using dict as type then these can be left off.
 data_model_definition_pandas = VectorStoreRecordDefinition(
     fields={
-        "vector": VectorStoreRecordVectorField(property_type="list[float]"),
+        "vector": float32_vector_field(),
         "key": VectorStoreRecordKeyField(property_type="str"),
         "content": VectorStoreRecordDataField(
             property_type="str", has_embedding=True, embedding_property_name="vector"
@@ -130,6 +181,24 @@ data_model_definition_pandas = VectorStoreRecordDefinition(
     from_dict=lambda records, **_: DataFrame(records),
 )
 
+TModel = TypeVar("TModel")
+
+
+# When creating many records at once, generate the vectors for all of them in a single call to the embedding service,
+# instead of one call per record, for instance:
+# records = await create_records(DataModelPydantic, ["Hello", "World"], OpenAITextEmbedding(...))
+async def create_records(
+    data_model_type: type[TModel], contents: list[str], embedding_service: EmbeddingGeneratorBase
+) -> list[TModel]:
+    vectors = await embedding_service.generate_embeddings(contents)
+    return [data_model_type(content=content, vector=vector) for content, vector in zip(contents, vectors)]
+
+
+# Stack the vectors of many records into a single contiguous (records x dimensions) matrix,
+# for instance to compute all the cosine similarities with a query vector in one matrix product.
+def stack_vectors(records: list[Any]) -> np.ndarray:
+    return np.stack([record.vector for record in records])
+
 
 if __name__ == "__main__":
     data_item1 = DataModelDataclass(content="Hello, world!", vector=[1.0, 2.0, 3.0], other=None)
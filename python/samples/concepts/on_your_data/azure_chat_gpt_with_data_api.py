@@ -45,13 +45,15 @@ req_settings = AzureChatPromptExecutionSettings(service_id="default", extra_body
 chat_service = AzureChatCompletion(service_id="chat-gpt")
 kernel.add_service(chat_service)
 
+# The system message comes first and the history only grows at the end, followed by the new user input,
+# so every request starts with the previous request's prompt and can benefit from service-side prompt caching.
 prompt_template_config = PromptTemplateConfig(
     template="{{$chat_history}}{{$user_input}}",
     name="chat",
     template_format="semantic-kernel",
     input_variables=[
         InputVariable(name="chat_history", description="The chat history", is_required=True),
-        InputVariable(name="request", description="The user input", is_required=True),
+        InputVariable(name="user_input", description="The user input", is_required=True),
     ],
     execution_settings={"default": req_settings},
 )
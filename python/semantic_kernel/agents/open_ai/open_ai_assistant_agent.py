@@ -2,7 +2,6 @@
 
 import logging
 from collections.abc import AsyncIterable
-from copy import copy
 from typing import TYPE_CHECKING, Any
 
 from openai import AsyncOpenAI
@@ -11,7 +10,7 @@ from pydantic import ValidationError
 from semantic_kernel.agents.open_ai.open_ai_assistant_base import OpenAIAssistantBase
 from semantic_kernel.connectors.ai.open_ai.settings.open_ai_settings import OpenAISettings
 from semantic_kernel.const import DEFAULT_SERVICE_NAME
-from semantic_kernel.exceptions.agent_exceptions import AgentInitializationException
+from semantic_kernel.exceptions.agent_exceptions import AgentFileNotFoundException, AgentInitializationException
 from semantic_kernel.utils.experimental_decorator import experimental_class
 from semantic_kernel.utils.telemetry.user_agent import APP_INFO, prepend_semantic_kernel_to_user_agent
 
@@ -50,11 +49,11 @@ class OpenAIAssistantAgent(OpenAIAssistantBase):
         enable_code_interpreter: bool | None = None,
         enable_file_search: bool | None = None,
         enable_json_response: bool | None = None,
-        code_interpreter_file_ids: list[str] | None = [],
+        code_interpreter_file_ids: list[str] | None = None,
         temperature: float | None = None,
         top_p: float | None = None,
         vector_store_id: str | None = None,
-        metadata: dict[str, Any] | None = {},
+        metadata: dict[str, Any] | None = None,
         max_completion_tokens: int | None = None,
         max_prompt_tokens: int | None = None,
         parallel_tool_calls_enabled: bool | None = True,
@@ -125,11 +124,9 @@ class OpenAIAssistantAgent(OpenAIAssistantBase):
             "enable_code_interpreter": enable_code_interpreter,
             "enable_file_search": enable_file_search,
             "enable_json_response": enable_json_response,
-            "code_interpreter_file_ids": code_interpreter_file_ids,
             "temperature": temperature,
             "top_p": top_p,
             "vector_store_id": vector_store_id,
-            "metadata": metadata,
             "max_completion_tokens": max_completion_tokens,
             "max_prompt_tokens": max_prompt_tokens,
             "parallel_tool_calls_enabled": parallel_tool_calls_enabled,
@@ -142,6 +139,10 @@ class OpenAIAssistantAgent(OpenAIAssistantBase):
             args["id"] = id
         if kernel is not None:
             args["kernel"] = kernel
+        if code_interpreter_file_ids is not None:
+            args["code_interpreter_file_ids"] = code_interpreter_file_ids
+        if metadata is not None:
+            args["metadata"] = metadata
         if kwargs:
             args.update(kwargs)
         super().__init__(**args)
@@ -171,7 +172,7 @@ class OpenAIAssistantAgent(OpenAIAssistantBase):
         temperature: float | None = None,
         top_p: float | None = None,
         vector_store_id: str | None = None,
-        metadata: dict[str, Any] | None = {},
+        metadata: dict[str, Any] | None = None,
         max_completion_tokens: int | None = None,
         max_prompt_tokens: int | None = None,
         parallel_tool_calls_enabled: bool | None = True,
@@ -243,28 +244,18 @@ class OpenAIAssistantAgent(OpenAIAssistantBase):
         assistant_create_kwargs: dict[str, Any] = {}
 
         if code_interpreter_filenames is not None:
-            code_interpreter_file_ids: list[str] = []
-            for file_path in code_interpreter_filenames:
-                try:
-                    file_id = await agent.add_file(file_path=file_path, purpose="assistants")
-                    code_interpreter_file_ids.append(file_id)
-                except FileNotFoundError as ex:
-                    logger.error(
-                        f"Failed to upload code interpreter file with path: `{file_path}` with exception: {ex}"
-                    )
-                    raise AgentInitializationException("Failed to upload code interpreter files.", ex) from ex
+            try:
+                code_interpreter_file_ids = await agent._add_files(code_interpreter_filenames, purpose="assistants")
+            except (FileNotFoundError, AgentFileNotFoundException) as ex:
+                raise AgentInitializationException("Failed to upload code interpreter files.", ex) from ex
             agent.code_interpreter_file_ids = code_interpreter_file_ids
             assistant_create_kwargs["code_interpreter_file_ids"] = code_interpreter_file_ids
 
         if vector_store_filenames is not None:
-            file_search_file_ids: list[str] = []
-            for file_path in vector_store_filenames:
-                try:
-                    file_id = await agent.add_file(file_path=file_path, purpose="assistants")
-                    file_search_file_ids.append(file_id)
-                except FileNotFoundError as ex:
-                    logger.error(f"Failed to upload file search file with path: `{file_path}` with exception: {ex}")
-                    raise AgentInitializationException("Failed to upload file search files.", ex) from ex
+            try:
+                file_search_file_ids = await agent._add_files(vector_store_filenames, purpose="assistants")
+            except (FileNotFoundError, AgentFileNotFoundException) as ex:
+                raise AgentInitializationException("Failed to upload file search files.", ex) from ex
 
             if enable_file_search or agent.enable_file_search:
                 vector_store_id = await agent.create_vector_store(file_ids=file_search_file_ids)
@@ -289,9 +280,7 @@ class OpenAIAssistantAgent(OpenAIAssistantBase):
         Returns:
             An OpenAI client instance.
         """
-        merged_headers = dict(copy(default_headers)) if default_headers else {}
-        if default_headers:
-            merged_headers.update(default_headers)
+        merged_headers = dict(default_headers) if default_headers else {}
         if APP_INFO:
             merged_headers.update(APP_INFO)
             merged_headers = prepend_semantic_kernel_to_user_agent(merged_headers)
@@ -344,8 +333,8 @@ class OpenAIAssistantAgent(OpenAIAssistantBase):
         Yields:
             An AsyncIterable of dictionaries representing the OpenAIAssistantDefinition.
         """
-        assistants = await self.client.beta.assistants.list(order="desc")
-        for assistant in assistants.data:
+        # iterating the paginator directly fetches further pages on demand, instead of only the first page
+        async for assistant in self.client.beta.assistants.list(order="desc"):
             yield self._create_open_ai_assistant_definition(assistant)
 
     @classmethod
@@ -397,6 +386,7 @@ class OpenAIAssistantAgent(OpenAIAssistantBase):
             )
         assistant = await client.beta.assistants.retrieve(id)
         assistant_definition = OpenAIAssistantBase._create_open_ai_assistant_definition(assistant)
-        return OpenAIAssistantAgent(kernel=kernel, **assistant_definition)
+        # the client used for the lookup is handed to the agent, so it is not created a second time
+        return cls(kernel=kernel, client=client, **assistant_definition)
 
     # endregion
@@ -46,6 +46,9 @@ if TYPE_CHECKING:
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# the number of files that are uploaded at the same time
+MAX_CONCURRENT_FILE_UPLOADS = 4
+
 
 @experimental_class
 class OpenAIAssistantBase(Agent):
@@ -98,11 +101,11 @@ class OpenAIAssistantBase(Agent):
         enable_code_interpreter: bool | None = None,
         enable_file_search: bool | None = None,
         enable_json_response: bool | None = None,
-        code_interpreter_file_ids: list[str] | None = [],
+        code_interpreter_file_ids: list[str] | None = None,
         temperature: float | None = None,
         top_p: float | None = None,
         vector_store_id: str | None = None,
-        metadata: dict[str, Any] | None = {},
+        metadata: dict[str, Any] | None = None,
         max_completion_tokens: int | None = None,
         max_prompt_tokens: int | None = None,
         parallel_tool_calls_enabled: bool | None = True,
@@ -124,11 +127,11 @@ class OpenAIAssistantBase(Agent):
             enable_code_interpreter: Enable code interpreter. Defaults to False. (optional)
             enable_file_search: Enable file search. Defaults to False. (optional)
             enable_json_response: Enable JSON response. Defaults to False. (optional)
-            code_interpreter_file_ids: The file ids. Defaults to []. (optional)
+            code_interpreter_file_ids: The file ids. Defaults to an empty list. (optional)
             temperature: The temperature. Defaults to None. (optional)
             top_p: The top p. Defaults to None. (optional)
             vector_store_id: The vector store id. Defaults to None. (optional)
-            metadata: The metadata. Defaults to {}. (optional)
+            metadata: The metadata. Defaults to an empty dictionary. (optional)
             max_completion_tokens: The max completion tokens. Defaults to None. (optional)
             max_prompt_tokens: The max prompt tokens. Defaults to None. (optional)
             parallel_tool_calls_enabled: Enable parallel tool calls. Defaults to True. (optional)
@@ -146,17 +149,20 @@ class OpenAIAssistantBase(Agent):
             "enable_code_interpreter": enable_code_interpreter,
             "enable_file_search": enable_file_search,
             "enable_json_response": enable_json_response,
-            "code_interpreter_file_ids": code_interpreter_file_ids,
             "temperature": temperature,
             "top_p": top_p,
             "vector_store_id": vector_store_id,
-            "metadata": metadata,
             "max_completion_tokens": max_completion_tokens,
             "max_prompt_tokens": max_prompt_tokens,
             "parallel_tool_calls_enabled": parallel_tool_calls_enabled,
             "truncation_message_count": truncation_message_count,
         }
 
+        # when not provided, the field's default_factory creates a new list / dict for this instance
+        if code_interpreter_file_ids is not None:
+            args["code_interpreter_file_ids"] = code_interpreter_file_ids
+        if metadata is not None:
+            args["metadata"] = metadata
         if name is not None:
             args["name"] = name
         if id is not None:
@@ -535,6 +541,34 @@ class OpenAIAssistantBase(Agent):
         except FileNotFoundError as ex:
             raise AgentFileNotFoundException(f"File not found: {file_path}") from ex
 
+    async def _add_files(self, file_paths: list[str], purpose: Literal["assistants", "vision"]) -> list[str]:
+        """Add several files concurrently, returning the file ids in the order of the file paths.
+
+        When an upload fails, the files that were uploaded are deleted again before the first error is raised.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FILE_UPLOADS)
+
+        async def add_file(file_path: str) -> str:
+            async with semaphore:
+                try:
+                    return await self.add_file(file_path=file_path, purpose=purpose)
+                except Exception as ex:
+                    logger.error(f"Failed to upload file with path: `{file_path}` with exception: {ex}")
+                    raise
+
+        results = await asyncio.gather(*[add_file(file_path) for file_path in file_paths], return_exceptions=True)
+        file_ids = [result for result in results if isinstance(result, str)]
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if not errors:
+            return file_ids
+        cleanup_results = await asyncio.gather(
+            *[self.delete_file(file_id) for file_id in file_ids], return_exceptions=True
+        )
+        for file_id, cleanup_result in zip(file_ids, cleanup_results):
+            if isinstance(cleanup_result, BaseException):
+                logger.warning(f"Failed to delete uploaded file with id: `{file_id}` with exception: {cleanup_result}")
+        raise errors[0]
+
     async def delete_file(self, file_id: str) -> None:
         """Delete a file.
 
@@ -4,7 +4,6 @@ import asyncio
 import logging
 import sys
 from collections.abc import AsyncGenerator
-from functools import reduce
 from typing import TYPE_CHECKING, Any
 
 from semantic_kernel.utils.telemetry.model_diagnostics.decorators import trace_chat_completion
@@ -308,7 +307,7 @@ class AzureAIInferenceChatCompletion(ChatCompletionClientBase, AzureAIInferenceB
                 # Response doesn't contain any function calls. No need to proceed to the next request.
                 return
 
-            full_completion: StreamingChatMessageContent = reduce(lambda x, y: x + y, all_messages)
+            full_completion = StreamingChatMessageContent.concat(all_messages)
             function_calls = [item for item in full_completion.items if isinstance(item, FunctionCallContent)]
             chat_history.add_message(message=full_completion)
 
@@ -1,11 +1,20 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
+import weakref
 from abc import ABC
 from typing import ClassVar
 
+import google.generativeai as genai
+from google.generativeai import GenerativeModel
+from google.generativeai.client import get_default_generative_async_client
+from pydantic import PrivateAttr
+
 from semantic_kernel.connectors.ai.google.google_ai.google_ai_settings import GoogleAISettings
 from semantic_kernel.kernel_pydantic import KernelBaseModel
 
+MAX_CACHED_MODELS = 16
+
 
 class GoogleAIBase(KernelBaseModel, ABC):
     """Google AI Service."""
@@ -13,3 +22,33 @@ class GoogleAIBase(KernelBaseModel, ABC):
     MODEL_PROVIDER_NAME: ClassVar[str] = "googleai"
 
     service_settings: GoogleAISettings
+
+    _models: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str | None, GenerativeModel]] = PrivateAttr(
+        default_factory=weakref.WeakKeyDictionary
+    )
+
+    def _get_model(self, system_instruction: str | None = None) -> GenerativeModel:
+        """Get the model for the system instruction, creating it on first use.
+
+        A model creates its async client on the first request and keeps it, so reusing the model
+        reuses the connection. That client is bound to the event loop it was created on,
+        so models are cached per running loop, and the models of closed loops are dropped.
+        """
+        for loop in [loop for loop in self._models if loop.is_closed()]:
+            del self._models[loop]
+        models = self._models.setdefault(asyncio.get_running_loop(), {})
+        if (model := models.get(system_instruction)) is None:
+            if len(models) >= MAX_CACHED_MODELS:
+                models.pop(next(iter(models)))
+            # configure resets the default clients of the library, so it is only called when a model is created
+            genai.configure(api_key=self.service_settings.api_key.get_secret_value())
+            model = GenerativeModel(
+                self.service_settings.gemini_model_id,
+                system_instruction=system_instruction,
+            )
+            # the model would otherwise pick up the default client on its first request, by which time
+            # another service may have configured the library with a different api key.
+            # _async_client is not public, so google-generativeai is pinned to 0.7 and the unit tests check it is used
+            model._async_client = get_default_generative_async_client()
+            models[system_instruction] = model
+        return model
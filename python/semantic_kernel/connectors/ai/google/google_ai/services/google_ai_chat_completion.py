@@ -1,14 +1,10 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-
 import logging
 import sys
 from collections.abc import AsyncGenerator
-from functools import reduce
 from typing import TYPE_CHECKING, Any
 
-import google.generativeai as genai
-from google.generativeai import GenerativeModel
 from google.generativeai.protos import Candidate, Content
 from google.generativeai.types import AsyncGenerateContentResponse, GenerateContentResponse, GenerationConfig
 from pydantic import ValidationError
@@ -161,11 +157,7 @@ class GoogleAIChatCompletion(GoogleAIBase, ChatCompletionClientBase):
         self, chat_history: ChatHistory, settings: GoogleAIChatPromptExecutionSettings
     ) -> list[ChatMessageContent]:
         """Send a chat request to the Google AI service."""
-        genai.configure(api_key=self.service_settings.api_key.get_secret_value())
-        model = GenerativeModel(
-            self.service_settings.gemini_model_id,
-            system_instruction=filter_system_message(chat_history),
-        )
+        model = self._get_model(filter_system_message(chat_history))
 
         response: AsyncGenerateContentResponse = await model.generate_content_async(
             contents=self._prepare_chat_history_for_request(chat_history),
@@ -204,7 +196,7 @@ class GoogleAIChatCompletion(GoogleAIBase, ChatCompletionClientBase):
                         name=format_gemini_function_name_to_kernel_function_fully_qualified_name(
                             part.function_call.name
                         ),
-                        arguments={k: v for k, v in part.function_call.args.items()},
+                        arguments=dict(part.function_call.args),
                     )
                 )
 
@@ -283,7 +275,7 @@ class GoogleAIChatCompletion(GoogleAIBase, ChatCompletionClientBase):
                 # Response doesn't contain any function calls. No need to proceed to the next request.
                 return
 
-            full_completion: StreamingChatMessageContent = reduce(lambda x, y: x + y, all_messages)
+            full_completion = StreamingChatMessageContent.concat(all_messages)
             function_calls = [item for item in full_completion.items if isinstance(item, FunctionCallContent)]
             chat_history.add_message(message=full_completion)
 
@@ -307,11 +299,7 @@ class GoogleAIChatCompletion(GoogleAIBase, ChatCompletionClientBase):
         settings: GoogleAIChatPromptExecutionSettings,
     ) -> AsyncGenerator[list[StreamingChatMessageContent], Any]:
         """Send a streaming chat request to the Google AI service."""
-        genai.configure(api_key=self.service_settings.api_key.get_secret_value())
-        model = GenerativeModel(
-            self.service_settings.gemini_model_id,
-            system_instruction=filter_system_message(chat_history),
-        )
+        model = self._get_model(filter_system_message(chat_history))
 
         response: AsyncGenerateContentResponse = await model.generate_content_async(
             contents=self._prepare_chat_history_for_request(chat_history),
@@ -322,6 +310,9 @@ class GoogleAIChatCompletion(GoogleAIBase, ChatCompletionClientBase):
         )
 
         async for chunk in response:
+            if not chunk.candidates:
+                # e.g. chunks carrying only prompt feedback; nothing to stream.
+                continue
             yield [self._create_streaming_chat_message_content(chunk, candidate) for candidate in chunk.candidates]
 
     def _create_streaming_chat_message_content(
@@ -361,7 +352,7 @@ class GoogleAIChatCompletion(GoogleAIBase, ChatCompletionClientBase):
                         name=format_gemini_function_name_to_kernel_function_fully_qualified_name(
                             part.function_call.name
                         ),
-                        arguments={k: v for k, v in part.function_call.args.items()},
+                        arguments=dict(part.function_call.args),
                     )
                 )
 
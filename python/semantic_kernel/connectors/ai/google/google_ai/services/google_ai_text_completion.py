@@ -4,8 +4,6 @@ import sys
 from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING, Any
 
-import google.generativeai as genai
-from google.generativeai import GenerativeModel
 from google.generativeai.protos import Candidate
 from google.generativeai.types import AsyncGenerateContentResponse, GenerateContentResponse, GenerationConfig
 from pydantic import ValidationError
@@ -92,10 +90,7 @@ class GoogleAITextCompletion(GoogleAIBase, TextCompletionClientBase):
 
     async def _send_request(self, prompt: str, settings: GoogleAITextPromptExecutionSettings) -> list[TextContent]:
         """Send a text generation request to the Google AI service."""
-        genai.configure(api_key=self.service_settings.api_key.get_secret_value())
-        model = GenerativeModel(
-            self.service_settings.gemini_model_id,
-        )
+        model = self._get_model()
 
         response: AsyncGenerateContentResponse = await model.generate_content_async(
             contents=prompt,
@@ -145,10 +140,7 @@ class GoogleAITextCompletion(GoogleAIBase, TextCompletionClientBase):
         self, prompt: str, settings: GoogleAITextPromptExecutionSettings
     ) -> AsyncGenerator[list[StreamingTextContent], Any]:
         """Send a text generation request to the Google AI service."""
-        genai.configure(api_key=self.service_settings.api_key.get_secret_value())
-        model = GenerativeModel(
-            self.service_settings.gemini_model_id,
-        )
+        model = self._get_model()
 
         response: AsyncGenerateContentResponse = await model.generate_content_async(
             contents=prompt,
@@ -157,6 +149,9 @@ class GoogleAITextCompletion(GoogleAIBase, TextCompletionClientBase):
         )
 
         async for chunk in response:
+            if not chunk.candidates:
+                # e.g. chunks carrying only prompt feedback; nothing to stream.
+                continue
             yield [self._create_streaming_text_content(chunk, candidate) for candidate in chunk.candidates]
 
     def _create_streaming_text_content(
@@ -32,16 +32,13 @@ def filter_system_message(chat_history: ChatHistory) -> str | None:
     If there are multiple system messages, raise an error.
     If there are no system messages, return None.
     """
-    if len([message for message in chat_history if message.role == AuthorRole.SYSTEM]) > 1:
+    system_messages = [message for message in chat_history if message.role == AuthorRole.SYSTEM]
+    if len(system_messages) > 1:
         raise ServiceInvalidRequestError(
             "Multiple system messages in chat history. Only one system message is expected."
         )
 
-    for message in chat_history:
-        if message.role == AuthorRole.SYSTEM:
-            return message.content
-
-    return None
+    return system_messages[0].content if system_messages else None
 
 
 async def invoke_function_calls(
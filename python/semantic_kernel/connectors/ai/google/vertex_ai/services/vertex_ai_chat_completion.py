@@ -2,7 +2,6 @@
 
 import sys
 from collections.abc import AsyncGenerator, AsyncIterable
-from functools import reduce
 from typing import Any
 
 import vertexai
@@ -197,7 +196,7 @@ class VertexAIChatCompletion(VertexAIBase, ChatCompletionClientBase):
                         name=format_gemini_function_name_to_kernel_function_fully_qualified_name(
                             part.function_call.name
                         ),
-                        arguments={k: v for k, v in part.function_call.args.items()},
+                        arguments=dict(part.function_call.args),
                     )
                 )
 
@@ -276,7 +275,7 @@ class VertexAIChatCompletion(VertexAIBase, ChatCompletionClientBase):
                 # Response doesn't contain any function calls. No need to proceed to the next request.
                 return
 
-            full_completion: StreamingChatMessageContent = reduce(lambda x, y: x + y, all_messages)
+            full_completion = StreamingChatMessageContent.concat(all_messages)
             function_calls = [item for item in full_completion.items if isinstance(item, FunctionCallContent)]
             chat_history.add_message(message=full_completion)
 
@@ -315,6 +314,9 @@ class VertexAIChatCompletion(VertexAIBase, ChatCompletionClientBase):
         )
 
         async for chunk in response:
+            if not chunk.candidates:
+                # e.g. chunks carrying only prompt feedback; nothing to stream.
+                continue
             yield [self._create_streaming_chat_message_content(chunk, candidate) for candidate in chunk.candidates]
 
     def _create_streaming_chat_message_content(
@@ -355,7 +357,7 @@ class VertexAIChatCompletion(VertexAIBase, ChatCompletionClientBase):
                         name=format_gemini_function_name_to_kernel_function_fully_qualified_name(
                             part.function_call.name
                         ),
-                        arguments={k: v for k, v in part.function_call.args.items()},
+                        arguments=dict(part.function_call.args),
                     )
                 )
 
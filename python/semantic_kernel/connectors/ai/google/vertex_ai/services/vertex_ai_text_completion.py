@@ -149,6 +149,9 @@ class VertexAITextCompletion(VertexAIBase, TextCompletionClientBase):
         )
 
         async for chunk in response:
+            if not chunk.candidates:
+                # e.g. chunks carrying only prompt feedback; nothing to stream.
+                continue
             yield [self._create_streaming_text_content(chunk, candidate) for candidate in chunk.candidates]
 
     def _create_streaming_text_content(self, chunk: GenerationResponse, candidate: Candidate) -> StreamingTextContent:
@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
 import sys
 from collections.abc import AsyncGenerator
@@ -98,7 +99,8 @@ class HuggingFaceTextCompletion(TextCompletionClientBase):
         assert isinstance(settings, HuggingFacePromptExecutionSettings)  # nosec
 
         try:
-            results = self.generator(prompt, **settings.prepare_settings_dict())
+            # the pipeline runs the model synchronously, so run it off the event loop
+            results = await asyncio.to_thread(self.generator, prompt, **settings.prepare_settings_dict())
         except Exception as e:
             raise ServiceResponseException("Hugging Face completion failed") from e
         if isinstance(results, list):
@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import logging
 import sys
 from typing import TYPE_CHECKING, Any
@@ -65,7 +66,7 @@ class HuggingFaceTextEmbedding(EmbeddingGeneratorBase):
     ) -> ndarray:
         try:
             logger.info(f"Generating embeddings for {len(texts)} texts.")
-            return self.generator.encode(sentences=texts, convert_to_numpy=True, **kwargs)
+            return await asyncio.to_thread(self.generator.encode, sentences=texts, convert_to_numpy=True, **kwargs)
         except Exception as e:
             raise ServiceResponseException("Hugging Face embeddings failed", e) from e
 
@@ -78,6 +79,6 @@ class HuggingFaceTextEmbedding(EmbeddingGeneratorBase):
     ) -> "list[Tensor] | ndarray | Tensor":
         try:
             logger.info(f"Generating raw embeddings for {len(texts)} texts.")
-            return self.generator.encode(sentences=texts, **kwargs)
+            return await asyncio.to_thread(self.generator.encode, sentences=texts, **kwargs)
         except Exception as e:
             raise ServiceResponseException("Hugging Face embeddings failed", e) from e
@@ -2,7 +2,6 @@
 
 import logging
 from collections.abc import Awaitable, Callable, Mapping
-from copy import copy
 
 from openai import AsyncAzureOpenAI
 from pydantic import ConfigDict, validate_call
@@ -56,7 +55,7 @@ class AzureOpenAIConfigBase(OpenAIHandler):
 
         """
         # Merge APP_INFO into the headers if it exists
-        merged_headers = dict(copy(default_headers)) if default_headers else {}
+        merged_headers = dict(default_headers) if default_headers else {}
         if APP_INFO:
             merged_headers.update(APP_INFO)
             merged_headers = prepend_semantic_kernel_to_user_agent(merged_headers)
@@ -4,7 +4,6 @@ import asyncio
 import logging
 import sys
 from collections.abc import AsyncGenerator
-from functools import reduce
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 if sys.version_info >= (3, 12):
@@ -216,7 +215,7 @@ class OpenAIChatCompletionBase(OpenAIHandler, ChatCompletionClientBase):
 
             # there is one response stream in the messages, combining now to create the full completion
             # depending on the prompt, the message may contain both function call content and others
-            full_completion: StreamingChatMessageContent = reduce(lambda x, y: x + y, all_messages)
+            full_completion = StreamingChatMessageContent.concat(all_messages)
             function_calls = [item for item in full_completion.items if isinstance(item, FunctionCallContent)]
             chat_history.add_message(message=full_completion)
 
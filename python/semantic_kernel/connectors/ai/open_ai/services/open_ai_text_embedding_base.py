@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 import sys
 from typing import TYPE_CHECKING, Any
 
@@ -20,6 +21,9 @@ from semantic_kernel.utils.experimental_decorator import experimental_class
 if TYPE_CHECKING:
     from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 
+# the number of embedding batches that are sent at the same time
+MAX_CONCURRENT_EMBEDDING_REQUESTS = 4
+
 
 @experimental_class
 class OpenAITextEmbeddingBase(OpenAIHandler, EmbeddingGeneratorBase):
@@ -58,18 +62,31 @@ class OpenAITextEmbeddingBase(OpenAIHandler, EmbeddingGeneratorBase):
             if not isinstance(settings, OpenAIEmbeddingPromptExecutionSettings):
                 settings = self.get_prompt_execution_settings_from_settings(settings)
         assert isinstance(settings, OpenAIEmbeddingPromptExecutionSettings)  # nosec
+        # the settings are copied so the caller's object is not modified by the model id and kwargs below
+        settings = settings.model_copy()
         if settings.ai_model_id is None:
             settings.ai_model_id = self.ai_model_id
         for key, value in kwargs.items():
             setattr(settings, key, value)
-        raw_embeddings = []
         batch_size = batch_size or len(texts)
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            settings.input = batch
-            raw_embedding = await self._send_embedding_request(settings=settings)
-            raw_embeddings.extend(raw_embedding)
-        return raw_embeddings
+        # the batches are independent requests, so they are sent concurrently, gather keeps them in order
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EMBEDDING_REQUESTS)
+
+        async def send_batch(batch: list[str]) -> list[Any]:
+            async with semaphore:
+                return await self._send_embedding_request(settings=settings.model_copy(update={"input": batch}))
+
+        tasks = [asyncio.ensure_future(send_batch(texts[i : i + batch_size])) for i in range(0, len(texts), batch_size)]
+        try:
+            raw_embeddings = await asyncio.gather(*tasks)
+        except BaseException:
+            # a failed batch fails the whole call, so the batches that are still pending are not sent
+            for task in tasks:
+                task.cancel()
+            # wait for the cancelled batches, so none is left running and none of their exceptions goes unretrieved
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return [embedding for batch in raw_embeddings for embedding in batch]
 
     def get_prompt_execution_settings_class(self) -> type["PromptExecutionSettings"]:
         """Get the request settings class."""
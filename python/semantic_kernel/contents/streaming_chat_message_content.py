@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+from collections.abc import Sequence
 from enum import Enum
 from typing import Any, Union, overload
 from xml.etree.ElementTree import Element  # nosec
@@ -45,6 +46,7 @@ class StreamingChatMessageContent(ChatMessageContent, StreamingContentMixin):
         __str__: Returns the content of the response.
         __bytes__: Returns the content of the response encoded in the encoding.
         __add__: Combines two StreamingChatMessageContent instances.
+        concat: Combines a sequence of StreamingChatMessageContent instances.
     """
 
     @overload
@@ -149,27 +151,19 @@ class StreamingChatMessageContent(ChatMessageContent, StreamingContentMixin):
         The inner_content of the first one is used, ai_model_id and encoding should be the same,
         if role is set, they should be the same.
         """
-        if not isinstance(other, StreamingChatMessageContent):
-            raise ContentAdditionException(
-                f"Cannot add other type to StreamingChatMessageContent, type supplied: {type(other)}"
-            )
-        if self.choice_index != other.choice_index:
-            raise ContentAdditionException("Cannot add StreamingChatMessageContent with different choice_index")
-        if self.ai_model_id != other.ai_model_id:
-            raise ContentAdditionException("Cannot add StreamingChatMessageContent from different ai_model_id")
-        if self.encoding != other.encoding:
-            raise ContentAdditionException("Cannot add StreamingChatMessageContent with different encoding")
-        if self.role and other.role and self.role != other.role:
-            raise ContentAdditionException("Cannot add StreamingChatMessageContent with different role")
+        self._check_can_add(other)
         if self.items or other.items:
             for other_item in other.items:
                 added = False
-                for id, item in enumerate(list(self.items)):
+                # try the latest items first, fragments without an id belong to the most recent matching call
+                for id in reversed(range(len(self.items))):
+                    item = self.items[id]
                     if type(item) is type(other_item) and hasattr(item, "__add__"):
                         try:
                             new_item = item + other_item  # type: ignore
                             self.items[id] = new_item
                             added = True
+                            break
                         except (ValueError, ContentAdditionException):
                             continue
                 if not added:
@@ -195,6 +189,98 @@ class StreamingChatMessageContent(ChatMessageContent, StreamingContentMixin):
             finish_reason=self.finish_reason or other.finish_reason,
         )
 
+    @classmethod
+    def concat(cls, chunks: Sequence["StreamingChatMessageContent"]) -> "StreamingChatMessageContent":
+        """Combine a sequence of StreamingChatMessageContent instances in a single pass.
+
+        The result is the same as adding all the chunks together with `+`, but the text of the
+        StreamingTextContent items is joined once at the end instead of being copied for every chunk,
+        so combining a long stream is linear instead of quadratic in the number of chunks.
+        The chunks themselves are not modified.
+
+        Args:
+            chunks: Sequence[StreamingChatMessageContent] - The chunks to combine, in order.
+
+        Returns:
+            StreamingChatMessageContent - The combined content.
+        """
+        if not chunks:
+            raise ContentAdditionException("Cannot combine an empty sequence of StreamingChatMessageContent")
+        first = chunks[0]
+        items: list[Any] = []
+        # maps the position of a text item in items to the text fragments that are joined at the end
+        text_fragments: dict[int, list[str]] = {}
+        text_positions: dict[tuple[int, str | None, str | None], int] = {}
+        inner_content: list[Any] = []
+        finish_reason: FinishReason | None = None
+        for chunk in chunks:
+            first._check_can_add(chunk)
+            for chunk_item in chunk.items:
+                if type(chunk_item) is StreamingTextContent:
+                    key = (chunk_item.choice_index, chunk_item.ai_model_id, chunk_item.encoding)
+                    if (position := text_positions.get(key)) is not None:
+                        text_fragments[position].append(chunk_item.text or "")
+                        continue
+                    text_positions[key] = len(items)
+                    text_fragments[len(items)] = [chunk_item.text or ""]
+                    items.append(chunk_item)
+                    continue
+                added = False
+                for index in reversed(range(len(items))):
+                    item = items[index]
+                    if type(item) is type(chunk_item) and hasattr(item, "__add__"):
+                        try:
+                            items[index] = item + chunk_item
+                            added = True
+                            break
+                        except (ValueError, ContentAdditionException):
+                            continue
+                if not added:
+                    items.append(chunk_item)
+            if isinstance(chunk.inner_content, list):
+                inner_content.extend(chunk.inner_content)
+            elif chunk.inner_content:
+                inner_content.append(chunk.inner_content)
+            finish_reason = finish_reason or chunk.finish_reason
+        for position, fragments in text_fragments.items():
+            if len(fragments) == 1:
+                continue
+            text_item = items[position]
+            items[position] = StreamingTextContent(
+                choice_index=text_item.choice_index,
+                inner_content=text_item.inner_content,
+                ai_model_id=text_item.ai_model_id,
+                metadata=text_item.metadata,
+                text="".join(fragments),
+                encoding=text_item.encoding,
+            )
+        return StreamingChatMessageContent(
+            role=first.role,
+            items=items,
+            choice_index=first.choice_index,
+            name=first.name,
+            inner_content=inner_content,
+            ai_model_id=first.ai_model_id,
+            metadata=first.metadata,
+            encoding=first.encoding,
+            finish_reason=finish_reason,
+        )
+
+    def _check_can_add(self, other: Any) -> None:
+        """Raise a ContentAdditionException when other cannot be added to this instance."""
+        if not isinstance(other, StreamingChatMessageContent):
+            raise ContentAdditionException(
+                f"Cannot add other type to StreamingChatMessageContent, type supplied: {type(other)}"
+            )
+        if self.choice_index != other.choice_index:
+            raise ContentAdditionException("Cannot add StreamingChatMessageContent with different choice_index")
+        if self.ai_model_id != other.ai_model_id:
+            raise ContentAdditionException("Cannot add StreamingChatMessageContent from different ai_model_id")
+        if self.encoding != other.encoding:
+            raise ContentAdditionException("Cannot add StreamingChatMessageContent with different encoding")
+        if self.role and other.role and self.role != other.role:
+            raise ContentAdditionException("Cannot add StreamingChatMessageContent with different role")
+
     def to_element(self) -> "Element":
         """Convert the StreamingChatMessageContent to an XML Element.
 
@@ -521,21 +521,25 @@ class VectorStoreRecordCollection(KernelBaseModel, Generic[TKey, TModel]):
             record = record[0]
         if isinstance(self.data_model_type, VectorStoreModelPydanticProtocol):
             try:
-                if not any(field.serialize_function is not None for field in self.data_model_definition.vector_fields):
+                if not any(
+                    field.deserialize_function is not None for field in self.data_model_definition.vector_fields
+                ):
                     return self.data_model_type.model_validate(record)
                 for field in self.data_model_definition.vector_fields:
-                    if field.serialize_function:
-                        record[field.name] = field.serialize_function(record[field.name])
+                    if field.deserialize_function:
+                        record[field.name] = field.deserialize_function(record[field.name])
                 return self.data_model_type.model_validate(record)
             except Exception as exc:
                 raise VectorStoreModelDeserializationException(f"Error deserializing record: {exc}") from exc
         if isinstance(self.data_model_type, VectorStoreModelToDictFromDictProtocol):
             try:
-                if not any(field.serialize_function is not None for field in self.data_model_definition.vector_fields):
+                if not any(
+                    field.deserialize_function is not None for field in self.data_model_definition.vector_fields
+                ):
                     return self.data_model_type.from_dict(record)
                 for field in self.data_model_definition.vector_fields:
-                    if field.serialize_function:
-                        record[field.name] = field.serialize_function(record[field.name])
+                    if field.deserialize_function:
+                        record[field.name] = field.deserialize_function(record[field.name])
                 return self.data_model_type.from_dict(record)
             except Exception as exc:
                 raise VectorStoreModelDeserializationException(f"Error deserializing record: {exc}") from exc
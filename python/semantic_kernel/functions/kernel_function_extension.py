@@ -390,10 +390,11 @@ class KernelFunctionExtension(KernelBaseModel, ABC):
         """
         if not self.plugins:
             return []
-        included_plugins = filters.get("included_plugins")
-        excluded_plugins = filters.get("excluded_plugins", [])
-        included_functions = filters.get("included_functions")
-        excluded_functions = filters.get("excluded_functions", [])
+        # the filters are checked for every plugin and function, so they are turned into sets once
+        included_plugins = set(filters.get("included_plugins") or ())
+        excluded_plugins = set(filters.get("excluded_plugins") or ())
+        included_functions = set(filters.get("included_functions") or ())
+        excluded_functions = set(filters.get("excluded_functions") or ())
         if included_plugins and excluded_plugins:
             raise ValueError("Cannot use both included_plugins and excluded_plugins at the same time.")
         if included_functions and excluded_functions:
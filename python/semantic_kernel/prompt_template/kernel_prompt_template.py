@@ -65,7 +65,7 @@ class KernelPromptTemplate(PromptTemplateBase):
 
     def extract_blocks(self) -> list[Block]:
         """Given the prompt template, extract all the blocks (text, variables, function calls)."""
-        logger.debug(f"Extracting blocks from template: {self.prompt_template_config.template}")
+        logger.debug("Extracting blocks from template: %s", self.prompt_template_config.template)
         if not self.prompt_template_config.template:
             return []
         return TemplateTokenizer.tokenize(self.prompt_template_config.template)
@@ -110,7 +110,7 @@ class KernelPromptTemplate(PromptTemplateBase):
         from semantic_kernel.template_engine.protocols.code_renderer import CodeRenderer
         from semantic_kernel.template_engine.protocols.text_renderer import TextRenderer
 
-        logger.debug(f"Rendering list of {len(blocks)} blocks")
+        logger.debug("Rendering list of %d blocks", len(blocks))
         rendered_blocks: list[str] = []
         arguments = self._get_trusted_arguments(arguments or KernelArguments())
         allow_unsafe_function_output = self._get_allow_dangerously_set_function_output()
@@ -126,5 +126,6 @@ class KernelPromptTemplate(PromptTemplateBase):
                     raise TemplateRenderException(f"Error rendering code block: {exc}") from exc
                 rendered_blocks.append(rendered if allow_unsafe_function_output else escape(rendered))
         prompt = "".join(rendered_blocks)
-        logger.debug(f"Rendered prompt: {prompt}")
+        # the prompt grows with the chat history, so it is only formatted when debug logging is enabled
+        logger.debug("Rendered prompt: %s", prompt)
         return prompt
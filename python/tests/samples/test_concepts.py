@@ -1,7 +1,9 @@
 # Copyright (c) Microsoft. All rights reserved.
 
 import copy
+from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pytest
 from pytest import mark, param
 
@@ -24,6 +26,8 @@ from samples.concepts.filtering.auto_function_invoke_filters import main as auto
 from samples.concepts.filtering.function_invocation_filters import main as function_invocation_filters
 from samples.concepts.filtering.function_invocation_filters_stream import main as function_invocation_filters_stream
 from samples.concepts.filtering.prompt_filters import main as prompt_filters
+from samples.concepts.filtering.semantic_caching import SemanticCache
+from samples.concepts.filtering.semantic_caching import main as semantic_caching
 from samples.concepts.functions.kernel_arguments import main as kernel_arguments
 from samples.concepts.grounding.grounded import main as grounded
 from samples.concepts.images.image_generation import main as image_generation
@@ -57,6 +61,8 @@ from samples.getting_started_with_agents.step1_agent import main as step1_agent
 from samples.getting_started_with_agents.step2_plugins import main as step2_plugins
 from samples.getting_started_with_agents.step3_chat import main as step3_chat
 from samples.getting_started_with_agents.step7_assistant import main as step7_assistant
+from semantic_kernel.contents import ChatHistory
+from semantic_kernel.functions import KernelArguments
 from tests.samples.samples_utils import retry
 
 concepts = [
@@ -74,6 +80,7 @@ concepts = [
     param(function_invocation_filters, ["What is 3+3?", "exit"], id="function_invocation_filters"),
     param(function_invocation_filters_stream, ["What is 3+3?", "exit"], id="function_invocation_filters_stream"),
     param(prompt_filters, ["What is the fastest animal?", "exit"], id="prompt_filters"),
+    param(semantic_caching, ["Why is the sky blue?", "Why is the sky blue?", "exit"], id="semantic_caching"),
     param(kernel_arguments, [], id="kernel_arguments"),
     param(grounded, [], id="grounded"),
     param(azure_cognitive_search_memory, [], id="azure_cognitive_search_memory"),
@@ -144,3 +151,26 @@ async def test_concepts(func, responses, monkeypatch):
 
     monkeypatch.setattr("builtins.input", lambda _: responses.pop(0))
     await retry(lambda: func(), reset=reset)
+
+
+@mark.asyncio
+async def test_semantic_caching_skips_repeated_prompt():
+    embedding_service = MagicMock()
+    embedding_service.generate_embeddings = AsyncMock(return_value=np.array([[1.0, 0.0]]))
+    cache = SemanticCache(embedding_service)
+    history = ChatHistory()
+    history.add_system_message("You are a chat bot.")
+
+    async def invoke_model(context):
+        context.result = "The sky is blue because of Rayleigh scattering."
+
+    next = AsyncMock(side_effect=invoke_model)
+    for _ in range(3):
+        context = MagicMock(arguments=KernelArguments(user_input="Why is the sky blue?", chat_history=history))
+        await cache.filter(context, next)
+        assert context.result == "The sky is blue because of Rayleigh scattering."
+        # the sample adds every exchange to the history, the cache must still hit
+        history.add_user_message("Why is the sky blue?")
+        history.add_assistant_message(str(context.result))
+
+    next.assert_awaited_once()
@@ -88,6 +88,21 @@ def test_create_client_from_configuration_missing_endpoint():
         AzureAssistantAgent._create_client(api_key="test")
 
 
+def test_initialization_with_client_reuses_client(kernel: Kernel, azure_openai_unit_test_env):
+    client = MagicMock(spec=AsyncAzureOpenAI)
+    with patch.object(AzureAssistantAgent, "_create_client") as mock_create_client:
+        agent = AzureAssistantAgent(kernel=kernel, service_id="test_service", name="test_name", client=client)
+    assert agent.client is client
+    mock_create_client.assert_not_called()
+
+
+@pytest.mark.parametrize("exclude_list", [["AZURE_OPENAI_API_KEY"]], indirect=True)
+def test_initialization_with_client_without_api_key(kernel: Kernel, azure_openai_unit_test_env):
+    client = MagicMock(spec=AsyncAzureOpenAI)
+    agent = AzureAssistantAgent(kernel=kernel, service_id="test_service", client=client, env_file_path="test.env")
+    assert agent.client is client
+
+
 @pytest.mark.asyncio
 async def test_create_agent(kernel: Kernel, azure_openai_unit_test_env):
     with patch.object(AzureAssistantAgent, "create_assistant", new_callable=AsyncMock) as mock_create_assistant:
@@ -191,7 +206,9 @@ async def test_list_definitions(kernel: Kernel, mock_assistant, azure_openai_uni
         mock_client_instance = mock_create_client.return_value
         mock_client_instance.beta = MagicMock()
         mock_client_instance.beta.assistants = MagicMock()
-        mock_client_instance.beta.assistants.list = AsyncMock(return_value=MagicMock(data=[mock_assistant]))
+        mock_paginator = MagicMock()
+        mock_paginator.__aiter__.return_value = [mock_assistant]
+        mock_client_instance.beta.assistants.list = MagicMock(return_value=mock_paginator)
 
         agent.client = mock_client_instance
 
@@ -318,6 +335,8 @@ async def test_retrieve_agent(kernel, azure_openai_unit_test_env):
             "truncation_message_count": 10,
         }
         mock_client_instance.beta.assistants.retrieve.assert_called_once_with("test_id")
+        mock_create_client.assert_called_once()
+        assert retrieved_agent.client is mock_client_instance
         OpenAIAssistantBase._create_open_ai_assistant_definition.assert_called_once()
 
 
@@ -258,7 +258,9 @@ async def test_list_definitions(kernel: Kernel, mock_assistant, openai_unit_test
         mock_client_instance = mock_create_client.return_value
         mock_client_instance.beta = MagicMock()
         mock_client_instance.beta.assistants = MagicMock()
-        mock_client_instance.beta.assistants.list = AsyncMock(return_value=MagicMock(data=[mock_assistant]))
+        mock_paginator = MagicMock()
+        mock_paginator.__aiter__.return_value = [mock_assistant]
+        mock_client_instance.beta.assistants.list = MagicMock(return_value=mock_paginator)
 
         agent.client = mock_client_instance
 
@@ -388,6 +390,7 @@ async def test_retrieve_agent(kernel, openai_unit_test_env):
             "truncation_message_count": 10,
         }
         mock_client_instance.beta.assistants.retrieve.assert_called_once_with("test_id")
+        assert retrieved_agent.client is mock_client_instance
         OpenAIAssistantBase._create_open_ai_assistant_definition.assert_called_once()
 
 
@@ -693,6 +693,39 @@ async def test_add_file_not_found(azure_openai_assistant_agent: AzureAssistantAg
                 await azure_openai_assistant_agent.add_file("test_file_path", "assistants")
 
 
+@pytest.mark.asyncio
+async def test_add_files(azure_openai_assistant_agent: AzureAssistantAgent, openai_unit_test_env):
+    with patch.object(
+        AzureAssistantAgent,
+        "add_file",
+        new_callable=AsyncMock,
+        side_effect=lambda file_path, purpose: f"id_{file_path}",
+    ) as mock_add_file:
+        file_ids = await azure_openai_assistant_agent._add_files(["a.txt", "b.txt"], purpose="assistants")
+
+        assert file_ids == ["id_a.txt", "id_b.txt"]
+        assert mock_add_file.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_add_files_deletes_uploaded_files_on_failure(
+    azure_openai_assistant_agent: AzureAssistantAgent, openai_unit_test_env
+):
+    async def add_file(file_path, purpose):
+        if file_path == "missing.txt":
+            raise AgentFileNotFoundException(f"File not found: {file_path}")
+        return f"id_{file_path}"
+
+    with (
+        patch.object(AzureAssistantAgent, "add_file", new_callable=AsyncMock, side_effect=add_file),
+        patch.object(AzureAssistantAgent, "delete_file", new_callable=AsyncMock) as mock_delete_file,
+        pytest.raises(AgentFileNotFoundException, match="File not found: missing.txt"),
+    ):
+        await azure_openai_assistant_agent._add_files(["a.txt", "missing.txt", "b.txt"], purpose="assistants")
+
+    assert sorted(call.args[0] for call in mock_delete_file.call_args_list) == ["id_a.txt", "id_b.txt"]
+
+
 @pytest.mark.asyncio
 async def test_delete_file(azure_openai_assistant_agent: AzureAssistantAgent, openai_unit_test_env):
     with patch.object(azure_openai_assistant_agent, "client", spec=AsyncAzureOpenAI) as mock_client:
@@ -118,6 +118,25 @@ async def mock_google_ai_streaming_chat_completion_response() -> AsyncGenerateCo
     )
 
 
+@pytest_asyncio.fixture()
+async def mock_google_ai_streaming_chat_completion_response_with_empty_chunk() -> AsyncGenerateContentResponse:
+    """Mock Google AI streaming Chat Completion response starting with a chunk without candidates."""
+    candidate = protos.Candidate()
+    candidate.index = 0
+    candidate.content = protos.Content(role="user", parts=[protos.Part(text="Test content")])
+    candidate.finish_reason = protos.Candidate.FinishReason.STOP
+
+    response = protos.GenerateContentResponse()
+    response.candidates.append(candidate)
+
+    iterable = MagicMock(spec=AsyncGenerator)
+    iterable.__aiter__.return_value = [protos.GenerateContentResponse(), response]
+
+    return await AsyncGenerateContentResponse.from_aiterator(
+        iterator=iterable,
+    )
+
+
 @pytest_asyncio.fixture()
 async def mock_google_ai_streaming_chat_completion_response_with_tool_call() -> AsyncGenerateContentResponse:
     """Mock Google AI streaming Chat Completion response with tool call."""
@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -108,6 +109,69 @@ async def test_google_ai_chat_completion(
     assert responses[0].inner_content == mock_google_ai_chat_completion_response
 
 
+@pytest.mark.asyncio
+@patch.object(GenerativeModel, "generate_content_async", new_callable=AsyncMock)
+async def test_google_ai_chat_completion_reuses_model(
+    mock_google_ai_model_generate_content_async,
+    google_ai_unit_test_env,
+    chat_history: ChatHistory,
+    mock_google_ai_chat_completion_response,
+) -> None:
+    """Test that requests with the same system instruction reuse the model"""
+    settings = GoogleAIChatPromptExecutionSettings()
+
+    mock_google_ai_model_generate_content_async.return_value = mock_google_ai_chat_completion_response
+
+    google_ai_chat_completion = GoogleAIChatCompletion()
+    await google_ai_chat_completion.get_chat_message_contents(chat_history, settings)
+    await google_ai_chat_completion.get_chat_message_contents(chat_history, settings)
+    assert len(google_ai_chat_completion._models[asyncio.get_running_loop()]) == 1
+
+    chat_history.add_system_message("Another system message")
+    await google_ai_chat_completion.get_chat_message_contents(chat_history, settings)
+    assert len(google_ai_chat_completion._models[asyncio.get_running_loop()]) == 2
+
+
+def test_google_ai_chat_completion_drops_models_of_closed_loops(google_ai_unit_test_env) -> None:
+    """Test that the models created on an event loop are dropped once the loop is closed"""
+    google_ai_chat_completion = GoogleAIChatCompletion()
+
+    async def get_model() -> asyncio.AbstractEventLoop:
+        google_ai_chat_completion._get_model(None)
+        return asyncio.get_running_loop()
+
+    first_loop = asyncio.run(get_model())
+    second_loop = asyncio.run(get_model())
+
+    assert first_loop not in google_ai_chat_completion._models
+    assert list(google_ai_chat_completion._models.keys()) == [second_loop]
+
+
+@pytest.mark.asyncio
+async def test_google_ai_chat_completion_model_binds_client(google_ai_unit_test_env) -> None:
+    """Test that a cached model keeps the client created with its own api key"""
+    google_ai_chat_completion = GoogleAIChatCompletion()
+    model = google_ai_chat_completion._get_model(None)
+    assert model._async_client is not None
+
+    other_model = GoogleAIChatCompletion(api_key="other_api_key")._get_model(None)
+
+    assert other_model._async_client is not model._async_client
+    assert google_ai_chat_completion._get_model(None)._async_client is model._async_client
+
+
+@pytest.mark.asyncio
+async def test_google_ai_chat_completion_model_sends_requests_with_bound_client(google_ai_unit_test_env) -> None:
+    """Test that the model sends its requests through the client bound when it was created"""
+    model = GoogleAIChatCompletion()._get_model(None)
+
+    with (
+        patch.object(model._async_client, "generate_content", side_effect=RuntimeError("bound client")),
+        pytest.raises(RuntimeError, match="bound client"),
+    ):
+        await model.generate_content_async("test")
+
+
 @pytest.mark.asyncio
 async def test_google_ai_chat_completion_with_function_choice_behavior_fail_verification(
     chat_history: ChatHistory,
@@ -234,6 +298,31 @@ async def test_google_ai_streaming_chat_completion(
     )
 
 
+@pytest.mark.asyncio
+@patch.object(GenerativeModel, "generate_content_async", new_callable=AsyncMock)
+async def test_google_ai_streaming_chat_completion_skips_chunks_without_candidates(
+    mock_google_ai_model_generate_content_async,
+    google_ai_unit_test_env,
+    chat_history: ChatHistory,
+    mock_google_ai_streaming_chat_completion_response_with_empty_chunk,
+) -> None:
+    """Test streaming chat completion with GoogleAIChatCompletion skips chunks without candidates"""
+    settings = GoogleAIChatPromptExecutionSettings()
+
+    mock_google_ai_model_generate_content_async.return_value = (
+        mock_google_ai_streaming_chat_completion_response_with_empty_chunk
+    )
+
+    google_ai_chat_completion = GoogleAIChatCompletion()
+    all_messages = [
+        messages
+        async for messages in google_ai_chat_completion.get_streaming_chat_message_contents(chat_history, settings)
+    ]
+
+    assert len(all_messages) == 1
+    assert all_messages[0][0].content == "Test content"
+
+
 @pytest.mark.asyncio
 async def test_google_ai_streaming_chat_completion_with_function_choice_behavior_fail_verification(
     chat_history: ChatHistory,
@@ -1,5 +1,6 @@
 # Copyright (c) Microsoft. All rights reserved.
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -95,6 +96,26 @@ async def test_google_ai_text_completion(
     assert responses[0].inner_content == mock_google_ai_text_completion_response
 
 
+@pytest.mark.asyncio
+@patch.object(GenerativeModel, "generate_content_async", new_callable=AsyncMock)
+async def test_google_ai_text_completion_reuses_model(
+    mock_google_model_generate_content_async,
+    google_ai_unit_test_env,
+    prompt: str,
+    mock_google_ai_text_completion_response,
+) -> None:
+    """Test that consecutive requests of GoogleAITextCompletion reuse the model"""
+    settings = GoogleAITextPromptExecutionSettings()
+
+    mock_google_model_generate_content_async.return_value = mock_google_ai_text_completion_response
+
+    google_ai_text_completion = GoogleAITextCompletion()
+    await google_ai_text_completion.get_text_contents(prompt, settings)
+    await google_ai_text_completion.get_text_contents(prompt, settings)
+
+    assert len(google_ai_text_completion._models[asyncio.get_running_loop()]) == 1
+
+
 # endregion text completion
 
 
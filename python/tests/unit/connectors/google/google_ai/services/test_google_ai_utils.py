@@ -54,6 +54,17 @@ def test_format_user_message():
     assert formatted_user_message[1].inline_data.data == image_content.data
 
 
+def test_format_user_message_with_multiple_text_items():
+    """Test format_user_message keeps the text of every TextContent item."""
+    user_message = ChatMessageContent(
+        role=AuthorRole.USER,
+        items=[TextContent(text="First text"), TextContent(text="Second text")],
+    )
+    formatted_user_message = format_user_message(user_message)
+
+    assert [part.text for part in formatted_user_message] == ["First text", "Second text"]
+
+
 def test_format_user_message_throws_with_unsupported_items() -> None:
     """Test format_user_message with unsupported items."""
     # Test with unsupported items, any item other than TextContent and ImageContent should raise an error
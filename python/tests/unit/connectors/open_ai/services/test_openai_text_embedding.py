@@ -1,6 +1,8 @@
 # Copyright (c) Microsoft. All rights reserved.
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import gc
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from openai import AsyncClient
@@ -10,6 +12,9 @@ from semantic_kernel.connectors.ai.open_ai.prompt_execution_settings.open_ai_pro
     OpenAIEmbeddingPromptExecutionSettings,
 )
 from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_embedding import OpenAITextEmbedding
+from semantic_kernel.connectors.ai.open_ai.services.open_ai_text_embedding_base import (
+    MAX_CONCURRENT_EMBEDDING_REQUESTS,
+)
 from semantic_kernel.connectors.ai.prompt_execution_settings import PromptExecutionSettings
 from semantic_kernel.exceptions.service_exceptions import ServiceInitializationError, ServiceResponseException
 
@@ -128,3 +133,74 @@ async def test_embedding_pes(mock_create, openai_unit_test_env) -> None:
         model=ai_model_id,
         dimensions=embedding_dimensions,
     )
+
+
+@pytest.mark.asyncio
+@patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock)
+async def test_embedding_batches_keep_order(mock_create, openai_unit_test_env) -> None:
+    ai_model_id = "test_model_id"
+    texts = ["one", "two", "three"]
+    mock_create.side_effect = lambda input, **kwargs: MagicMock(
+        data=[MagicMock(embedding=[float(len(text))]) for text in input], usage=None
+    )
+    settings = OpenAIEmbeddingPromptExecutionSettings(ai_model_id=ai_model_id)
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id=ai_model_id)
+
+    embeddings = await openai_text_embedding.generate_raw_embeddings(texts, settings, batch_size=2)
+
+    assert embeddings == [[3.0], [3.0], [5.0]]
+    assert mock_create.await_count == 2
+    assert settings.input is None
+
+
+@pytest.mark.asyncio
+@patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock)
+async def test_embedding_batches_bounded_concurrency(mock_create, openai_unit_test_env) -> None:
+    running = 0
+    max_running = 0
+
+    async def create(input, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return MagicMock(data=[MagicMock(embedding=[1.0]) for _ in input], usage=None)
+
+    mock_create.side_effect = create
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id")
+
+    embeddings = await openai_text_embedding.generate_raw_embeddings(["text"] * 10, batch_size=1)
+
+    assert len(embeddings) == 10
+    assert max_running == MAX_CONCURRENT_EMBEDDING_REQUESTS
+
+
+@pytest.mark.asyncio
+@patch.object(AsyncEmbeddings, "create", new_callable=AsyncMock)
+async def test_embedding_batches_cancelled_on_error(mock_create, openai_unit_test_env) -> None:
+    async def create(input, **kwargs):
+        if input == ["fail"]:
+            raise Exception("batch failed")
+        try:
+            # the other batches only finish when they are cancelled
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            raise Exception("request aborted")
+
+    mock_create.side_effect = create
+    openai_text_embedding = OpenAITextEmbedding(ai_model_id="test_model_id")
+    loop_errors = []
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(lambda _, context: loop_errors.append(context))
+
+    try:
+        with pytest.raises(ServiceResponseException):
+            await openai_text_embedding.generate_raw_embeddings(["fail"] + ["text"] * 10, batch_size=1)
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    # the failed batch and the batches that filled the free slots are sent, the rest is cancelled before it starts
+    assert mock_create.await_count == MAX_CONCURRENT_EMBEDDING_REQUESTS + 1
+    assert loop_errors == []
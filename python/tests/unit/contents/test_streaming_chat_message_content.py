@@ -398,6 +398,110 @@ def test_smsc_add_exception(message1, message2):
         message1 + message2
 
 
+def test_scmc_concat():
+    chunks = [
+        StreamingChatMessageContent(
+            choice_index=0,
+            role=AuthorRole.ASSISTANT,
+            items=[FunctionCallContent(id="test1", index=0, name="test", arguments='{"a": ')],
+            inner_content="source1",
+        ),
+        StreamingChatMessageContent(
+            choice_index=0,
+            role=AuthorRole.ASSISTANT,
+            items=[FunctionCallContent(index=0, arguments='"b"}')],
+            inner_content="source2",
+        ),
+        StreamingChatMessageContent(choice_index=0, role=AuthorRole.ASSISTANT, content="Hello, ", inner_content="s3"),
+        StreamingChatMessageContent(choice_index=0, role=AuthorRole.ASSISTANT, content="world", inner_content="s4"),
+        StreamingChatMessageContent(
+            choice_index=0, role=AuthorRole.ASSISTANT, content="!", finish_reason=FinishReason.STOP
+        ),
+    ]
+    combined = StreamingChatMessageContent.concat(chunks)
+    assert combined.role == AuthorRole.ASSISTANT
+    assert combined.content == "Hello, world!"
+    assert len(combined.items) == 2
+    assert combined.items[0].id == "test1"
+    assert combined.items[0].arguments == '{"a": "b"}'
+    assert combined.inner_content == ["source1", "source2", "s3", "s4"]
+    assert combined.finish_reason == FinishReason.STOP
+    assert chunks[0].items[0].arguments == '{"a": '
+    assert chunks[2].content == "Hello, "
+
+
+def test_scmc_add_merges_item_once():
+    def chunks() -> list[StreamingChatMessageContent]:
+        return [
+            StreamingChatMessageContent(
+                choice_index=0,
+                role=AuthorRole.ASSISTANT,
+                items=[
+                    FunctionCallContent(id="test1", index=0, name="test", arguments='{"a": '),
+                    FunctionCallContent(id="test2", index=0, name="test", arguments='{"c": '),
+                ],
+            ),
+            StreamingChatMessageContent(
+                choice_index=0,
+                role=AuthorRole.ASSISTANT,
+                items=[FunctionCallContent(index=0, arguments='"b"}')],
+            ),
+        ]
+
+    message1, message2 = chunks()
+    for combined in (message1 + message2, StreamingChatMessageContent.concat(chunks())):
+        assert len(combined.items) == 2
+        assert combined.items[0].arguments == '{"a": '
+        assert combined.items[1].arguments == '{"c": "b"}'
+
+
+def test_scmc_add_parallel_tool_calls_same_index():
+    def chunks() -> list[StreamingChatMessageContent]:
+        return [
+            StreamingChatMessageContent(
+                choice_index=0, role=AuthorRole.ASSISTANT, items=[FunctionCallContent(id="a", index=0, name="a")]
+            ),
+            StreamingChatMessageContent(
+                choice_index=0, role=AuthorRole.ASSISTANT, items=[FunctionCallContent(index=0, arguments='{"x": 1}')]
+            ),
+            StreamingChatMessageContent(
+                choice_index=0, role=AuthorRole.ASSISTANT, items=[FunctionCallContent(id="b", index=0, name="b")]
+            ),
+            StreamingChatMessageContent(
+                choice_index=0, role=AuthorRole.ASSISTANT, items=[FunctionCallContent(index=0, arguments='{"y": 2}')]
+            ),
+        ]
+
+    added = chunks()
+    for combined in (
+        added[0] + added[1] + added[2] + added[3],
+        StreamingChatMessageContent.concat(chunks()),
+    ):
+        assert [item.id for item in combined.items] == ["a", "b"]
+        assert combined.items[0].arguments == '{"x": 1}'
+        assert combined.items[1].arguments == '{"y": 2}'
+
+
+def test_scmc_concat_single():
+    chunk = StreamingChatMessageContent(choice_index=0, role=AuthorRole.USER, content="Hello")
+    combined = StreamingChatMessageContent.concat([chunk])
+    assert combined.content == "Hello"
+    assert len(combined.items) == 1
+
+
+def test_scmc_concat_empty():
+    with pytest.raises(ContentAdditionException):
+        StreamingChatMessageContent.concat([])
+
+
+def test_scmc_concat_exception():
+    with pytest.raises(ContentAdditionException):
+        StreamingChatMessageContent.concat([
+            StreamingChatMessageContent(choice_index=0, role=AuthorRole.USER, content="Hello, "),
+            StreamingChatMessageContent(choice_index=0, role=AuthorRole.ASSISTANT, content="world!"),
+        ])
+
+
 def test_scmc_bytes():
     message = StreamingChatMessageContent(choice_index=0, role=AuthorRole.USER, content="Hello, world!")
     assert bytes(message) == b"Hello, world!"
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Annotated, Any
 
 import numpy as np
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pytest import fixture
 
 from semantic_kernel.data.vector_store_model_decorator import vectorstoremodel
@@ -300,6 +300,25 @@ def data_model_type_pydantic():
     return DataModelClass
 
 
+@fixture
+def data_model_type_pydantic_vector_array():
+    @vectorstoremodel
+    class DataModelClass(BaseModel):
+        model_config = ConfigDict(arbitrary_types_allowed=True)
+
+        content: Annotated[str, VectorStoreRecordDataField()]
+        vector: Annotated[
+            np.ndarray,
+            VectorStoreRecordVectorField(
+                serialize_function=np.ndarray.tolist,
+                deserialize_function=np.array,
+            ),
+        ]
+        id: Annotated[str, VectorStoreRecordKeyField()]
+
+    return DataModelClass
+
+
 @fixture
 def data_model_type_dataclass():
     @vectorstoremodel
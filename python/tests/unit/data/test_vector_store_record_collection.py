@@ -31,6 +31,7 @@ def vector_store_record_collection(
     data_model_type_pydantic,
     data_model_type_dataclass,
     data_model_type_vector_array,
+    data_model_type_pydantic_vector_array,
     request,
 ) -> VectorStoreRecordCollection:
     item = request.param if request and hasattr(request, "param") else "definition_basic"
@@ -47,6 +48,7 @@ def vector_store_record_collection(
         "type_pydantic": data_model_type_pydantic,
         "type_dataclass": data_model_type_dataclass,
         "type_vector_array": data_model_type_vector_array,
+        "type_pydantic_vector_array": data_model_type_pydantic_vector_array,
     }
     if item.endswith("pandas"):
         return DictVectorStoreRecordCollection(
@@ -104,6 +106,7 @@ async def test_context_manager(DictVectorStoreRecordCollection, data_model_defin
         "type_pydantic",
         "type_dataclass",
         "type_vector_array",
+        "type_pydantic_vector_array",
     ],
     indirect=True,
 )